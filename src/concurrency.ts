@@ -0,0 +1,28 @@
+/**
+ * Helpers for running network-bound work concurrently
+ */
+
+/**
+ * Map items through an async function with at most `limit` calls in flight.
+ * Results are returned in input order.
+ */
+export async function mapConcurrent<T, R>(
+    items: readonly T[],
+    limit: number,
+    fn: (item: T, index: number) => Promise<R>
+): Promise<R[]> {
+    const results = new Array<R>(items.length);
+    let next = 0;
+
+    const worker = async (): Promise<void> => {
+        while (next < items.length) {
+            const index = next++;
+            results[index] = await fn(items[index], index);
+        }
+    };
+
+    const workerCount = Math.max(1, Math.min(limit, items.length));
+    await Promise.all(Array.from({ length: workerCount }, worker));
+
+    return results;
+}
@@ -0,0 +1,10 @@
+/**
+ * DOI helpers
+ */
+
+/**
+ * Normalize a DOI for comparison (DOIs are case-insensitive)
+ */
+export function normalizeDoi(doi: string): string {
+    return doi.trim().toLowerCase();
+}
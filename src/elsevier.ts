@@ -5,11 +5,26 @@
  * and the ScienceDirect Full-Text API for retrieving content.
  */
 
+import { logger } from './logger.js';
 import type { Paper } from './types.js';
 
 const SCOPUS_SEARCH_URL = 'https://api.elsevier.com/content/search/scopus';
 const SCIDIR_ARTICLE_URL = 'https://api.elsevier.com/content/article/doi';
 
+// Abort requests that stall, so one slow response cannot hold up a run
+const REQUEST_TIMEOUT_MS = 30_000;
+
+// Only request the search fields we parse, to shrink the response payload
+const SEARCH_FIELDS = [
+    'prism:doi',
+    'dc:title',
+    'dc:creator',
+    'prism:coverDate',
+    'prism:publicationName',
+    'dc:description',
+    'link',
+].join(',');
+
 interface ElsevierSearchEntry {
     'prism:doi'?: string;
     'dc:title'?: string;
@@ -58,23 +73,31 @@ interface ElsevierFullTextResponse {
 export function parseAuthorSearchResponse(response: ElsevierSearchResponse): Paper[] {
     const entries = response['search-results']?.entry || [];
 
-    return entries
-        .filter((entry) => entry['prism:doi']) // Only papers with DOIs
-        .map((entry): Paper => {
-            // Find ScienceDirect link for PDF
-            const scidirLink = entry.link?.find(l => l['@ref'] === 'scidir');
-            const pdfUrl = scidirLink ? `${scidirLink['@href']}/pdfft` : undefined;
-
-            return {
-                doi: entry['prism:doi']!,
-                title: entry['dc:title'] || 'Untitled',
-                authors: entry['dc:creator'] ? [entry['dc:creator']] : [],
-                publicationDate: entry['prism:coverDate'] || '',
-                journal: entry['prism:publicationName'] || '',
-                abstract: entry['dc:description'] || '',
-                pdfUrl,
-            };
+    // Single pass over the entries, reading each field once
+    const papers: Paper[] = [];
+    for (const entry of entries) {
+        const doi = entry['prism:doi'];
+        if (!doi) {
+            continue; // Only papers with DOIs
+        }
+
+        // Find ScienceDirect link for PDF
+        const scidirLink = entry.link?.find(l => l['@ref'] === 'scidir');
+        const pdfUrl = scidirLink ? `${scidirLink['@href']}/pdfft` : undefined;
+        const creator = entry['dc:creator'];
+
+        papers.push({
+            doi,
+            title: entry['dc:title'] || 'Untitled',
+            authors: creator ? [creator] : [],
+            publicationDate: entry['prism:coverDate'] || '',
+            journal: entry['prism:publicationName'] || '',
+            abstract: entry['dc:description'] || '',
+            pdfUrl,
         });
+    }
+
+    return papers;
 }
 
 /**
@@ -99,12 +122,21 @@ export function parseFullTextResponse(response: ElsevierFullTextResponse): strin
             return abstract || '';
         }
 
-        return sections.map((section) => {
-            const title = section['ce:section-title'] || '';
+        // Collect headings and paragraphs into one list and join once,
+        // rather than building an intermediate string per section
+        const parts: string[] = [];
+        for (const section of sections) {
+            parts.push(`## ${section['ce:section-title'] || ''}`);
+
             const para = section['ce:para'];
-            const paraText = Array.isArray(para) ? para.join('\n\n') : (para || '');
-            return `## ${title}\n\n${paraText}`;
-        }).join('\n\n');
+            if (Array.isArray(para) && para.length > 0) {
+                parts.push(...para);
+            } else {
+                parts.push(typeof para === 'string' ? para : '');
+            }
+        }
+
+        return parts.join('\n\n');
     } catch {
         return '';
     }
@@ -121,11 +153,14 @@ export class ElsevierClient {
     }
 
     private async request<T>(url: string): Promise<T> {
+        // Node's built-in fetch keeps connections alive and pools them per
+        // origin, so every request to api.elsevier.com shares TCP/TLS sessions
         const response = await fetch(url, {
             headers: {
                 'X-ELS-APIKey': this.apiKey,
                 'Accept': 'application/json',
             },
+            signal: AbortSignal.timeout(REQUEST_TIMEOUT_MS),
         });
 
         if (!response.ok) {
@@ -136,21 +171,27 @@ export class ElsevierClient {
     }
 
     /**
-     * Search for papers by journal names from the specified lookback period
+     * Search for papers by journal names from the lookback period ending at `now`
      */
-    async searchJournalPapers(journals: string[], lookbackDays: number = 1): Promise<Paper[]> {
+    async searchJournalPapers(
+        journals: string[],
+        lookbackDays: number = 1,
+        now: Date = new Date()
+    ): Promise<Paper[]> {
         // Build query for multiple journals using OR
         const journalQueries = journals.map(j => `SRCTITLE("${j}")`).join(' OR ');
         
-        // Calculate date N days ago in YYYYMMDD format for ORIG-LOAD-DATE
-        const pastDate = new Date();
-        pastDate.setDate(pastDate.getDate() - lookbackDays);
+        // Calculate date N days ago in YYYYMMDD format for ORIG-LOAD-DATE.
+        // Use UTC throughout so the result matches the UTC toISOString() output.
+        const pastDate = new Date(now);
+        pastDate.setUTCDate(pastDate.getUTCDate() - lookbackDays);
         const dateStr = pastDate.toISOString().slice(0, 10).replace(/-/g, '');
         
         // Search for papers from specified journals loaded in the lookback period
         const query = `(${journalQueries}) AND ORIG-LOAD-DATE AFT ${dateStr}`;
 
-        const url = `${SCOPUS_SEARCH_URL}?query=${encodeURIComponent(query)}&sort=coverDate`;
+        const url = `${SCOPUS_SEARCH_URL}?query=${encodeURIComponent(query)}` +
+            `&sort=coverDate&field=${encodeURIComponent(SEARCH_FIELDS)}`;
         const response = await this.request<ElsevierSearchResponse>(url);
 
         return parseAuthorSearchResponse(response);
@@ -166,7 +207,7 @@ export class ElsevierClient {
             const response = await this.request<ElsevierFullTextResponse>(url);
             return parseFullTextResponse(response);
         } catch (error) {
-            console.warn(`Could not fetch full text for ${doi}:`, error);
+            logger.warn(`Could not fetch full text for ${doi}:`, error);
             return '';
         }
     }
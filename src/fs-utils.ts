@@ -0,0 +1,15 @@
+/**
+ * File system helpers
+ */
+
+import { rename, writeFile } from 'fs/promises';
+
+/**
+ * Write a file atomically: write to a temporary file, then rename it over
+ * the target so a crash mid-write never leaves a truncated file behind
+ */
+export async function writeFileAtomic(path: string, content: string): Promise<void> {
+    const tmpPath = `${path}.tmp`;
+    await writeFile(tmpPath, content, 'utf-8');
+    await rename(tmpPath, path);
+}
@@ -10,13 +10,18 @@
  */
 
 import { ElsevierClient } from './elsevier.js';
-import { Summarizer } from './summarizer.js';
+import { Summarizer, truncateContent } from './summarizer.js';
 import { NotionClient } from './notion.js';
+import { mapConcurrent } from './concurrency.js';
+import { logger } from './logger.js';
 import { loadState, saveState, filterNewPapers, markImported } from './state.js';
-import type { Config, ImportState, Paper } from './types.js';
+import type { Config, ImportState, Paper, PaperSummary } from './types.js';
 
 const STATE_FILE = './import-state.json';
 
+// Maximum number of concurrent full-text requests to Elsevier
+const FULL_TEXT_CONCURRENCY = 5;
+
 // Default journals to search for
 const DEFAULT_JOURNALS = [
     'NeuroImage',
@@ -46,6 +51,13 @@ function loadConfig(): Config {
         throw new Error('LOOKBACK_DAYS must be a positive integer');
     }
 
+    // Parse Gemini request concurrency from environment variable or use default of 5
+    const geminiConcurrencyEnv = process.env.GEMINI_CONCURRENCY;
+    const geminiConcurrency = geminiConcurrencyEnv ? parseInt(geminiConcurrencyEnv, 10) : 5;
+    if (isNaN(geminiConcurrency) || geminiConcurrency < 1) {
+        throw new Error('GEMINI_CONCURRENCY must be a positive integer');
+    }
+
     return {
         elsevier: {
             apiKey: required('ELSEVIER_API_KEY'),
@@ -58,6 +70,7 @@ function loadConfig(): Config {
         gemini: {
             apiKey: required('GEMINI_API_KEY'),
             model: process.env.GEMINI_MODEL || 'gemini-2.5-flash-lite',
+            concurrency: geminiConcurrency,
         },
         dryRun: process.argv.includes('--dry-run'),
         singleDoi: process.argv.find((arg) => arg.startsWith('--doi='))?.split('=')[1],
@@ -65,74 +78,89 @@ function loadConfig(): Config {
     };
 }
 
-async function importPaper(
-    paper: Paper,
-    elsevier: ElsevierClient,
-    summarizer: Summarizer,
-    notion: NotionClient,
-    config: Config
-): Promise<void> {
-    console.log(`\n📄 Processing: ${paper.title}`);
-    console.log(`   DOI: ${paper.doi}`);
-
-    // Fetch full text for better summary
-    console.log('   ⏳ Fetching full text...');
-    const fullText = await elsevier.getFullText(paper.doi);
+/**
+ * Fetch the content used for summarization (full text, or abstract as fallback).
+ * Clears `paper.fullText` after reading it and may fill in `paper.abstract`.
+ */
+async function fetchPaperContent(paper: Paper, elsevier: ElsevierClient): Promise<string> {
+    // Fetch full text for better summary, unless it was already retrieved.
+    // Only the truncated copy returned below is used afterwards, so drop the
+    // raw text from the paper rather than keeping it for the whole run.
+    const fullText = paper.fullText ?? await elsevier.getFullText(paper.doi);
+    paper.fullText = undefined;
 
     // If no full text, get abstract
     if (!fullText && !paper.abstract) {
-        console.log('   ⏳ Fetching abstract...');
         paper.abstract = await elsevier.getAbstract(paper.doi);
     }
 
-    // Generate AI summary
-    console.log('   🤖 Generating AI summary...');
-    const summary = await summarizer.summarize(paper, fullText);
-    console.log(`   💡 TL;DR: ${summary.tldr}`);
+    return truncateContent(fullText);
+}
+
+async function importPaper(
+    paper: Paper,
+    summary: PaperSummary,
+    notion: NotionClient,
+    config: Config
+): Promise<void> {
+    logger.info(`\n📄 Processing: ${paper.title}`);
+    logger.info(`   DOI: ${paper.doi}`);
+    logger.info(`   💡 TL;DR: ${summary.tldr}`);
 
     if (config.dryRun) {
-        console.log('   🏃 DRY RUN - would create Notion page');
-        console.log('   Summary:', JSON.stringify(summary, null, 2));
+        logger.info('   🏃 DRY RUN - would create Notion page');
+        // Skip serializing the summary when info output is disabled
+        if (logger.isEnabled('info')) {
+            logger.info('   Summary:', JSON.stringify(summary, null, 2));
+        }
         return;
     }
 
     // Create Notion page
-    console.log('   📝 Creating Notion page...');
+    logger.info('   📝 Creating Notion page...');
     const pageId = await notion.createPaperPage(
         config.notion.parentPageId,
         paper,
         summary
     );
-    console.log(`   ✅ Created page: ${pageId}`);
+    logger.info(`   ✅ Created page: ${pageId}`);
 }
 
 async function main(): Promise<void> {
-    console.log('🚀 Elsevier-to-Notion Paper Importer');
-    console.log('====================================\n');
+    logger.info('🚀 Elsevier-to-Notion Paper Importer');
+    logger.info('====================================\n');
+
+    // Timestamp the whole run once
+    const runStart = new Date();
+    const runAt = runStart.toISOString();
 
     // Load configuration
     const config = loadConfig();
-    console.log(`📋 Journals: ${config.elsevier.journals.join(', ')}`);
-    console.log(`📋 Lookback days: ${config.lookbackDays}`);
-    console.log(`📋 Dry run: ${config.dryRun}`);
+    logger.info(`📋 Journals: ${config.elsevier.journals.join(', ')}`);
+    logger.info(`📋 Lookback days: ${config.lookbackDays}`);
+    logger.info(`📋 Dry run: ${config.dryRun}`);
     if (config.singleDoi) {
-        console.log(`📋 Single DOI mode: ${config.singleDoi}`);
+        logger.info(`📋 Single DOI mode: ${config.singleDoi}`);
     }
 
     // Initialize clients
     const elsevier = new ElsevierClient(config.elsevier.apiKey);
-    const summarizer = new Summarizer(config.gemini.apiKey, config.gemini.model);
+    const summarizer = new Summarizer(
+        config.gemini.apiKey,
+        config.gemini.model,
+        config.gemini.concurrency
+    );
     const notion = new NotionClient(config.notion.token);
 
     // Load state
     let state = await loadState(STATE_FILE);
-    console.log(`📊 Previously imported: ${state.importedDois.length} papers`);
+    logger.info(`📊 Previously imported: ${state.importedDois.length} papers`);
 
     // Fetch papers
     let papers: Paper[];
     if (config.singleDoi) {
         // Single DOI mode for testing
-        console.log('\n🔍 Fetching single paper...');
+        logger.info('\n🔍 Fetching single paper...');
         const fullText = await elsevier.getFullText(config.singleDoi);
         papers = [{
             doi: config.singleDoi,
@@ -145,42 +173,60 @@ async function main(): Promise<void> {
         }];
     } else {
         // Normal mode - search by journals (using lookback days)
-        console.log(`\n🔍 Searching for papers from the last ${config.lookbackDays} day(s)...`);
-        papers = await elsevier.searchJournalPapers(config.elsevier.journals, config.lookbackDays);
-        console.log(`   Found ${papers.length} papers`);
+        logger.info(`\n🔍 Searching for papers from the last ${config.lookbackDays} day(s)...`);
+        papers = await elsevier.searchJournalPapers(
+            config.elsevier.journals,
+            config.lookbackDays,
+            runStart
+        );
+        logger.info(`   Found ${papers.length} papers`);
     }
 
     // Filter new papers
     const newPapers = filterNewPapers(papers, state);
-    console.log(`   New papers to import: ${newPapers.length}`);
+    logger.info(`   New papers to import: ${newPapers.length}`);
 
     if (newPapers.length === 0) {
-        console.log('\n✨ No new papers to import. All done!');
+        logger.info('\n✨ No new papers to import. All done!');
         return;
     }
 
+    // Fetch content for all new papers concurrently
+    logger.info(`\n⏳ Fetching full text for ${newPapers.length} papers...`);
+    const fullTexts = await mapConcurrent(
+        newPapers,
+        FULL_TEXT_CONCURRENCY,
+        (paper) => fetchPaperContent(paper, elsevier)
+    );
+
+    // Generate AI summaries, batching several papers per request
+    logger.info(`🤖 Generating AI summaries for ${newPapers.length} papers...`);
+    const summaries = await summarizer.summarizeBatch(
+        newPapers.map((paper, index) => ({ paper, fullText: fullTexts[index] }))
+    );
+
     // Process each paper
-    for (const paper of newPapers) {
+    for (const [index, paper] of newPapers.entries()) {
         try {
-            await importPaper(paper, elsevier, summarizer, notion, config);
+            await importPaper(paper, summaries[index], notion, config);
 
             // Update state
-            state = markImported(state, paper.doi);
+            state = markImported(state, paper.doi, runAt);
             if (!config.dryRun) {
                 await saveState(STATE_FILE, state);
             }
         } catch (error) {
-            console.error(`   ❌ Failed to import ${paper.doi}:`, error);
+            logger.error(`   ❌ Failed to import ${paper.doi}:`, error);
             // Continue with next paper
         }
     }
 
-    console.log('\n====================================');
-    console.log('✅ Import complete!');
-    console.log(`   Processed: ${newPapers.length} papers`);
+    logger.info('\n====================================');
+    logger.info('✅ Import complete!');
+    logger.info(`   Processed: ${newPapers.length} papers`);
 }
 
 main().catch((error) => {
-    console.error('Fatal error:', error);
+    logger.error('Fatal error:', error);
     process.exit(1);
 });
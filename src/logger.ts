@@ -0,0 +1,53 @@
+/**
+ * Leveled logging for the import pipeline
+ *
+ * Verbosity is controlled by the LOG_LEVEL environment variable
+ * (debug, info, warn or error; defaults to info).
+ */
+
+export type LogLevel = 'debug' | 'info' | 'warn' | 'error';
+
+const LEVEL_PRIORITY: Record<LogLevel, number> = {
+    debug: 10,
+    info: 20,
+    warn: 30,
+    error: 40,
+};
+
+export interface Logger {
+    isEnabled(level: LogLevel): boolean;
+    debug(...args: unknown[]): void;
+    info(...args: unknown[]): void;
+    warn(...args: unknown[]): void;
+    error(...args: unknown[]): void;
+}
+
+/**
+ * Create a logger that drops messages below the given level.
+ * An unrecognised level falls back to info with a warning.
+ */
+export function createLogger(level: string = 'info'): Logger {
+    const normalized = level.trim().toLowerCase() || 'info';
+    const known = Object.hasOwn(LEVEL_PRIORITY, normalized);
+    if (!known) {
+        console.warn(
+            `Unknown log level "${level}", using "info". ` +
+            `Expected one of: ${Object.keys(LEVEL_PRIORITY).join(', ')}`
+        );
+    }
+    const threshold = known
+        ? LEVEL_PRIORITY[normalized as LogLevel]
+        : LEVEL_PRIORITY.info;
+    const isEnabled = (messageLevel: LogLevel): boolean =>
+        LEVEL_PRIORITY[messageLevel] >= threshold;
+
+    return {
+        isEnabled,
+        debug: (...args) => { if (isEnabled('debug')) console.debug(...args); },
+        info: (...args) => { if (isEnabled('info')) console.log(...args); },
+        warn: (...args) => { if (isEnabled('warn')) console.warn(...args); },
+        error: (...args) => { if (isEnabled('error')) console.error(...args); },
+    };
+}
+
+export const logger = createLogger(process.env.LOG_LEVEL);
@@ -2,10 +2,18 @@
  * Notion API client for creating paper pages
  */
 
+import { Agent } from 'https';
 import { Client } from '@notionhq/client';
 import type { BlockObjectRequest } from '@notionhq/client/build/src/api-endpoints.js';
 import type { Paper, PaperSummary } from './types.js';
 
+// Patterns used to normalize page IDs, compiled once at module load
+const SURROUNDING_QUOTES_PATTERN = /^["']|["']$/g;
+const URL_PAGE_ID_PATTERN = /([a-f0-9]{32})(?:\?|$)/i;
+const URL_TITLED_PAGE_ID_PATTERN = /-([a-f0-9]{32})(?:\?|$)/i;
+const DASHES_PATTERN = /-/g;
+const COMPACT_UUID_PATTERN = /^[a-f0-9]{32}$/i;
+
 /**
  * Normalize a Notion page ID to standard UUID format.
  * Handles various input formats:
@@ -16,22 +24,22 @@ import type { Paper, PaperSummary } from './types.js';
  */
 export function normalizeNotionPageId(input: string): string {
     // Remove surrounding quotes if present
-    let cleaned = input.trim().replace(/^["']|["']$/g, '');
+    let cleaned = input.trim().replace(SURROUNDING_QUOTES_PATTERN, '');
 
     // Extract from Notion URL if it's a URL
     // URLs look like: https://www.notion.so/workspace/Page-Title-12345678123412341234123456789012
     // or: https://notion.so/12345678123412341234123456789012
-    const urlMatch = cleaned.match(/([a-f0-9]{32})(?:\?|$)/i) ||
-                     cleaned.match(/-([a-f0-9]{32})(?:\?|$)/i);
+    const urlMatch = cleaned.match(URL_PAGE_ID_PATTERN) ||
+                     cleaned.match(URL_TITLED_PAGE_ID_PATTERN);
     if (urlMatch) {
         cleaned = urlMatch[1];
     }
 
     // Remove any dashes to get a compact UUID
-    const compact = cleaned.replace(/-/g, '');
+    const compact = cleaned.replace(DASHES_PATTERN, '');
 
     // Validate it looks like a UUID (32 hex characters)
-    if (!/^[a-f0-9]{32}$/i.test(compact)) {
+    if (!COMPACT_UUID_PATTERN.test(compact)) {
         throw new Error(
             `Invalid Notion page ID: "${input}". Expected a valid UUID or Notion URL. ` +
             `Please use a 32-character hex string (with or without dashes) or a Notion page URL.`
@@ -231,7 +239,12 @@ export class NotionClient {
     private client: Client;
 
     constructor(token: string) {
-        this.client = new Client({ auth: token });
+        // Node 18's default agent closes the connection after each request,
+        // so keep it open explicitly to reuse TCP + TLS sessions between pages
+        this.client = new Client({
+            auth: token,
+            agent: new Agent({ keepAlive: true }),
+        });
     }
 
     /**
@@ -4,9 +4,15 @@
  * Stores DOIs of imported papers in a JSON file to prevent duplicates.
  */
 
-import { readFile, writeFile } from 'fs/promises';
+import { readFile } from 'fs/promises';
+import { normalizeDoi } from './doi.js';
+import { writeFileAtomic } from './fs-utils.js';
 import type { ImportState } from './types.js';
 
+// Maximum number of DOIs to remember. Searches only cover the lookback
+// window, so the oldest imports can be dropped without risking duplicates.
+export const MAX_IMPORTED_DOIS = 5000;
+
 const DEFAULT_STATE: ImportState = {
     importedDois: [],
     lastRun: '',
@@ -32,33 +38,44 @@ export async function loadState(path: string): Promise<ImportState> {
  * Save import state to file
  */
 export async function saveState(path: string, state: ImportState): Promise<void> {
-    await writeFile(path, JSON.stringify(state, null, 2), 'utf-8');
+    await writeFileAtomic(path, JSON.stringify(state, null, 2));
 }
 
 /**
  * Check if a paper has already been imported
  */
 export function isImported(state: ImportState, doi: string): boolean {
-    return state.importedDois.includes(doi);
+    const key = normalizeDoi(doi);
+    return state.importedDois.some((imported) => normalizeDoi(imported) === key);
 }
 
 /**
- * Mark a paper as imported
+ * Mark a paper as imported during the run started at `runAt` (ISO timestamp),
+ * keeping only the most recent MAX_IMPORTED_DOIS
  */
-export function markImported(state: ImportState, doi: string): ImportState {
+export function markImported(state: ImportState, doi: string, runAt: string): ImportState {
     return {
         ...state,
-        importedDois: [...state.importedDois, doi],
-        lastRun: new Date().toISOString(),
+        importedDois: [...state.importedDois, doi].slice(-MAX_IMPORTED_DOIS),
+        lastRun: runAt,
     };
 }
 
 /**
- * Filter out already imported papers
+ * Filter out already imported papers and duplicate DOIs within `papers`
  */
 export function filterNewPapers<T extends { doi: string }>(
     papers: T[],
     state: ImportState
 ): T[] {
-    return papers.filter((paper) => !isImported(state, paper.doi));
+    // Build the lookup once rather than scanning importedDois for every paper
+    const seen = new Set(state.importedDois.map(normalizeDoi));
+    return papers.filter((paper) => {
+        const key = normalizeDoi(paper.doi);
+        if (seen.has(key)) {
+            return false;
+        }
+        seen.add(key);
+        return true;
+    });
 }
@@ -2,8 +2,16 @@
  * AI-powered paper summarization using Google Gemini
  */
 
-import { GoogleGenerativeAI } from '@google/generative-ai';
-import type { Paper, PaperSummary } from './types.js';
+import {
+    GoogleGenerativeAI,
+    type GenerateContentRequest,
+    type GenerateContentResult,
+    type GenerativeModel,
+} from '@google/generative-ai';
+import { mapConcurrent } from './concurrency.js';
+import { normalizeDoi } from './doi.js';
+import { logger } from './logger.js';
+import type { Paper, PaperSummary, SummaryInput } from './types.js';
 
 const SYSTEM_PROMPT = `You are a scientific paper summarizer. Given a paper's metadata and content, 
 generate a structured summary in JSON format with these fields:
@@ -15,15 +23,51 @@ generate a structured summary in JSON format with these fields:
 
 Respond ONLY with valid JSON, no additional text.`;
 
+const BATCH_SYSTEM_PROMPT = `You are a scientific paper summarizer. Given several papers' metadata
+and content, generate a structured summary for each paper. Respond with a JSON array containing
+one object per paper with these fields:
+
+- doi: the DOI of the paper being summarized, exactly as given
+- keyFindings: array of 3-5 bullet points highlighting the main discoveries
+- methodology: brief description of the research methods used (1-2 sentences)
+- implications: what this means for the field or real-world applications (1-2 sentences)
+- tldr: one-sentence summary for busy readers
+
+Respond ONLY with valid JSON, no additional text.`;
+
+// Maximum number of papers summarized in a single request
+const SUMMARY_BATCH_SIZE = 10;
+
+// Output token budget per summarized paper
+const MAX_OUTPUT_TOKENS_PER_PAPER = 1000;
+
+// Retry settings for rate-limited (HTTP 429) requests
+const MAX_RATE_LIMIT_RETRIES = 3;
+const RATE_LIMIT_BASE_DELAY_MS = 2000;
+
+// Maximum characters of paper content included in a prompt
+export const MAX_CONTENT_CHARS = 8000;
+
+// Matches a JSON payload wrapped in a markdown code block
+const CODE_BLOCK_PATTERN = /```(?:json)?\s*([\s\S]*?)\s*```/;
+
 /**
- * Build the user prompt with paper details
+ * Truncate content to the excerpt sent in a prompt.
+ * Applying it to already truncated content returns it unchanged.
  */
-export function buildSummaryPrompt(paper: Paper, fullText: string): string {
-    const content = fullText || paper.abstract || 'No content available';
+export function truncateContent(content: string): string {
+    return content.length > MAX_CONTENT_CHARS
+        ? `${content.slice(0, MAX_CONTENT_CHARS)}...[truncated]`
+        : content;
+}
 
-    return `Please summarize this scientific paper:
+/**
+ * Format a paper's metadata and content for inclusion in a prompt
+ */
+function formatPaperDetails(paper: Paper, fullText: string): string {
+    const content = fullText || paper.abstract || 'No content available';
 
-**Title:** ${paper.title}
+    return `**Title:** ${paper.title}
 **Authors:** ${paper.authors.join(', ') || 'Unknown'}
 **Journal:** ${paper.journal || 'Unknown'}
 **Date:** ${paper.publicationDate || 'Unknown'}
@@ -32,7 +76,52 @@ export function buildSummaryPrompt(paper: Paper, fullText: string): string {
 ${paper.abstract || 'No abstract available'}
 
 **Full Text (excerpt):**
-${content.slice(0, 8000)}${content.length > 8000 ? '...[truncated]' : ''}`;
+${truncateContent(content)}`;
+}
+
+/**
+ * Build the user prompt with paper details
+ */
+export function buildSummaryPrompt(paper: Paper, fullText: string): string {
+    return `Please summarize this scientific paper:
+
+${formatPaperDetails(paper, fullText)}`;
+}
+
+/**
+ * Build a single user prompt covering several numbered papers
+ */
+export function buildBatchSummaryPrompt(items: SummaryInput[]): string {
+    const papers = items
+        .map(({ paper, fullText }, index) =>
+            `## Paper ${index + 1}\n\n**DOI:** ${paper.doi}\n${formatPaperDetails(paper, fullText)}`)
+        .join('\n\n---\n\n');
+
+    return `Please summarize each of these ${items.length} scientific papers:
+
+${papers}`;
+}
+
+/**
+ * Extract and parse JSON from an LLM response, unwrapping a markdown code block if present
+ */
+function parseJsonResponse(response: string): unknown {
+    const jsonMatch = response.match(CODE_BLOCK_PATTERN);
+    const jsonStr = jsonMatch ? jsonMatch[1] : response;
+
+    return JSON.parse(jsonStr.trim());
+}
+
+/**
+ * Convert a parsed JSON object into a structured summary
+ */
+function toPaperSummary(parsed: Record<string, unknown>): PaperSummary {
+    return {
+        keyFindings: Array.isArray(parsed.keyFindings) ? parsed.keyFindings : [],
+        methodology: String(parsed.methodology || ''),
+        implications: String(parsed.implications || ''),
+        tldr: String(parsed.tldr || 'No summary available'),
+    };
 }
 
 /**
@@ -47,33 +136,114 @@ export function parseSummaryResponse(response: string): PaperSummary {
     };
 
     try {
-        // Extract JSON from markdown code block if present
-        const jsonMatch = response.match(/```(?:json)?\s*([\s\S]*?)\s*```/);
-        const jsonStr = jsonMatch ? jsonMatch[1] : response;
-
-        const parsed = JSON.parse(jsonStr.trim());
-
-        return {
-            keyFindings: Array.isArray(parsed.keyFindings) ? parsed.keyFindings : [],
-            methodology: String(parsed.methodology || ''),
-            implications: String(parsed.implications || ''),
-            tldr: String(parsed.tldr || 'No summary available'),
-        };
+        return toPaperSummary(parseJsonResponse(response) as Record<string, unknown>);
     } catch {
         return fallback;
     }
 }
 
+/**
+ * Parse a batched LLM response into summaries in the order of `dois`.
+ * Summaries are matched on the DOI echoed by the model, never on position,
+ * so a reordered or renumbered response cannot attach a summary to the
+ * wrong paper. Papers missing from the response are left undefined.
+ */
+export function parseBatchSummaryResponse(
+    response: string,
+    dois: string[]
+): Array<PaperSummary | undefined> {
+    const summaries = new Array<PaperSummary | undefined>(dois.length).fill(undefined);
+
+    try {
+        const parsed = parseJsonResponse(response);
+        if (!Array.isArray(parsed)) {
+            return summaries;
+        }
+
+        const indexByDoi = new Map(dois.map((doi, index) => [normalizeDoi(doi), index]));
+        for (const item of parsed) {
+            if (typeof item?.doi !== 'string') {
+                continue;
+            }
+            const index = indexByDoi.get(normalizeDoi(item.doi));
+            if (index !== undefined && !summaries[index]) {
+                summaries[index] = toPaperSummary(item);
+            }
+        }
+    } catch {
+        // Leave all summaries undefined so callers fall back to single requests
+    }
+
+    return summaries;
+}
+
+/**
+ * Check whether an error is a Gemini rate limit (quota exhausted) response
+ */
+function isRateLimitError(error: unknown): boolean {
+    return (error as { status?: number } | undefined)?.status === 429;
+}
+
+/**
+ * Build the summary recorded for a paper whose summarization failed
+ */
+function errorSummary(error: unknown): PaperSummary {
+    return {
+        keyFindings: [],
+        methodology: '',
+        implications: '',
+        tldr: `Error generating summary: ${error instanceof Error ? error.message : 'Unknown error'}`,
+    };
+}
+
 /**
  * AI summarizer using Google Gemini
  */
 export class Summarizer {
     private genAI: GoogleGenerativeAI;
     private model: string;
+    private concurrency: number;
+    private generativeModels = new Map<string, GenerativeModel>();
 
-    constructor(apiKey: string, model: string = 'gemini-2.5-flash-lite') {
+    constructor(apiKey: string, model: string = 'gemini-2.5-flash-lite', concurrency: number = 5) {
         this.genAI = new GoogleGenerativeAI(apiKey);
         this.model = model;
+        this.concurrency = concurrency;
+    }
+
+    /**
+     * Get the model for a system instruction, creating it once on first use
+     */
+    private getModel(systemInstruction: string): GenerativeModel {
+        let generativeModel = this.generativeModels.get(systemInstruction);
+        if (!generativeModel) {
+            generativeModel = this.genAI.getGenerativeModel({
+                model: this.model,
+                systemInstruction,
+            });
+            this.generativeModels.set(systemInstruction, generativeModel);
+        }
+        return generativeModel;
+    }
+
+    /**
+     * Generate content, retrying with exponential backoff when rate limited
+     */
+    private async generateContent(
+        systemInstruction: string,
+        request: GenerateContentRequest
+    ): Promise<GenerateContentResult> {
+        for (let attempt = 0; ; attempt++) {
+            try {
+                return await this.getModel(systemInstruction).generateContent(request);
+            } catch (error) {
+                if (!isRateLimitError(error) || attempt >= MAX_RATE_LIMIT_RETRIES) {
+                    throw error;
+                }
+                const delay = RATE_LIMIT_BASE_DELAY_MS * 2 ** attempt;
+                await new Promise((resolve) => setTimeout(resolve, delay));
+            }
+        }
     }
 
     /**
@@ -83,31 +253,80 @@ export class Summarizer {
         const userPrompt = buildSummaryPrompt(paper, fullText);
 
         try {
-            const model = this.genAI.getGenerativeModel({
-                model: this.model,
-                systemInstruction: SYSTEM_PROMPT,
-            });
-            const response = await model.generateContent({
+            const response = await this.generateContent(SYSTEM_PROMPT, {
                 contents: [{
                     role: 'user',
                     parts: [{ text: userPrompt }],
                 }],
                 generationConfig: {
                     temperature: 0.3, // Lower for more consistent output
-                    maxOutputTokens: 1000,
+                    maxOutputTokens: MAX_OUTPUT_TOKENS_PER_PAPER,
                 },
             });
 
             const content = response.response.text() || '';
             return parseSummaryResponse(content);
         } catch (error) {
-            console.error('Summarization failed:', error);
-            return {
-                keyFindings: [],
-                methodology: '',
-                implications: '',
-                tldr: `Error generating summary: ${error instanceof Error ? error.message : 'Unknown error'}`,
-            };
+            logger.error('Summarization failed:', error);
+            return errorSummary(error);
+        }
+    }
+
+    /**
+     * Generate summaries for several papers, sending up to SUMMARY_BATCH_SIZE
+     * papers per request. Papers missing from a batched response are
+     * summarized individually. Requests run concurrently up to the
+     * configured limit.
+     */
+    async summarizeBatch(items: SummaryInput[]): Promise<PaperSummary[]> {
+        const batches: SummaryInput[][] = [];
+        for (let start = 0; start < items.length; start += SUMMARY_BATCH_SIZE) {
+            batches.push(items.slice(start, start + SUMMARY_BATCH_SIZE));
+        }
+
+        const batchSummaries = (await mapConcurrent(
+            batches,
+            this.concurrency,
+            async (batch) => batch.length > 1 ? this.requestBatch(batch) : [undefined]
+        )).flat();
+
+        return mapConcurrent(
+            items,
+            this.concurrency,
+            async ({ paper, fullText }, index) => batchSummaries[index] ?? this.summarize(paper, fullText)
+        );
+    }
+
+    /**
+     * Request summaries for a batch of papers in a single call. Papers left
+     * undefined should be retried individually; a batch that stays rate
+     * limited returns error summaries instead.
+     */
+    private async requestBatch(batch: SummaryInput[]): Promise<Array<PaperSummary | undefined>> {
+        try {
+            const response = await this.generateContent(BATCH_SYSTEM_PROMPT, {
+                contents: [{
+                    role: 'user',
+                    parts: [{ text: buildBatchSummaryPrompt(batch) }],
+                }],
+                generationConfig: {
+                    temperature: 0.3,
+                    maxOutputTokens: MAX_OUTPUT_TOKENS_PER_PAPER * batch.length,
+                    responseMimeType: 'application/json',
+                },
+            });
+
+            const content = response.response.text() || '';
+            return parseBatchSummaryResponse(content, batch.map(({ paper }) => paper.doi));
+        } catch (error) {
+            logger.error('Batch summarization failed:', error);
+
+            // The quota is still exhausted after retrying, so per-paper
+            // requests would only hit the same limit
+            if (isRateLimitError(error)) {
+                return new Array<PaperSummary>(batch.length).fill(errorSummary(error));
+            }
+            return new Array<PaperSummary | undefined>(batch.length).fill(undefined);
         }
     }
 }
@@ -22,6 +22,12 @@ export interface PaperSummary {
     tldr: string;
 }
 
+/** A paper paired with the content used to summarize it */
+export interface SummaryInput {
+    paper: Paper;
+    fullText: string;
+}
+
 /** Configuration for the importer */
 export interface Config {
     elsevier: {
@@ -35,6 +41,7 @@ export interface Config {
     gemini: {
         apiKey: string;
         model: string;
+        concurrency: number;
     };
     dryRun: boolean;
     singleDoi?: string;
@@ -0,0 +1,34 @@
+import { describe, it, expect } from 'vitest';
+import { mapConcurrent } from '../src/concurrency.js';
+
+describe('mapConcurrent', () => {
+    it('should return results in input order', async () => {
+        const delays = [30, 10, 20];
+
+        const results = await mapConcurrent(delays, 3, async (delay, index) => {
+            await new Promise((resolve) => setTimeout(resolve, delay));
+            return index;
+        });
+
+        expect(results).toEqual([0, 1, 2]);
+    });
+
+    it('should not exceed the concurrency limit', async () => {
+        let inFlight = 0;
+        let maxInFlight = 0;
+
+        await mapConcurrent([1, 2, 3, 4, 5, 6], 2, async () => {
+            inFlight++;
+            maxInFlight = Math.max(maxInFlight, inFlight);
+            await new Promise((resolve) => setTimeout(resolve, 5));
+            inFlight--;
+        });
+
+        expect(maxInFlight).toBe(2);
+    });
+
+    it('should handle an empty list', async () => {
+        const results = await mapConcurrent([], 5, async (item) => item);
+        expect(results).toEqual([]);
+    });
+});
@@ -105,6 +105,40 @@ describe('ElsevierClient', () => {
             expect(fullText).toContain('Methods');
         });
 
+        it('should join sections and multiple paragraphs with blank lines', () => {
+            const mockResponse = {
+                'full-text-retrieval-response': {
+                    'originalText': {
+                        'xocs:doc': {
+                            'xocs:serial-item': {
+                                'ja:article': {
+                                    'ja:body': {
+                                        'ce:sections': {
+                                            'ce:section': [
+                                                {
+                                                    'ce:section-title': 'Introduction',
+                                                    'ce:para': ['First paragraph.', 'Second paragraph.']
+                                                },
+                                                {
+                                                    'ce:section-title': 'Methods'
+                                                }
+                                            ]
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            };
+
+            const fullText = parseFullTextResponse(mockResponse);
+
+            expect(fullText).toBe(
+                '## Introduction\n\nFirst paragraph.\n\nSecond paragraph.\n\n## Methods\n\n'
+            );
+        });
+
         it('should handle missing full text gracefully', () => {
             const mockResponse = {};
             const fullText = parseFullTextResponse(mockResponse);
@@ -150,6 +184,40 @@ describe('ElsevierClient', () => {
             expect(calledUrl).toContain('ORIG-LOAD-DATE');
         });
 
+        it('should only request the fields that are parsed', async () => {
+            mockFetch.mockResolvedValueOnce({
+                ok: true,
+                json: () => Promise.resolve({
+                    'search-results': { entry: [] }
+                })
+            });
+
+            await client.searchJournalPapers(['NeuroImage']);
+
+            const calledUrl = new URL(mockFetch.mock.calls[0][0]);
+            expect(calledUrl.searchParams.get('field')?.split(',')).toEqual(expect.arrayContaining([
+                'prism:doi',
+                'dc:title',
+                'link',
+            ]));
+        });
+
+        it('should set a timeout on requests', async () => {
+            mockFetch.mockResolvedValueOnce({
+                ok: true,
+                json: () => Promise.resolve({
+                    'search-results': { entry: [] }
+                })
+            });
+
+            await client.searchJournalPapers(['NeuroImage']);
+
+            expect(mockFetch).toHaveBeenCalledWith(
+                expect.any(String),
+                expect.objectContaining({ signal: expect.any(AbortSignal) })
+            );
+        });
+
         it('should throw on API error', async () => {
             mockFetch.mockResolvedValueOnce({
                 ok: false,
@@ -174,7 +242,7 @@ describe('ElsevierClient', () => {
             
             // Calculate expected date (7 days ago)
             const expectedDate = new Date();
-            expectedDate.setDate(expectedDate.getDate() - lookbackDays);
+            expectedDate.setUTCDate(expectedDate.getUTCDate() - lookbackDays);
             const expectedDateStr = expectedDate.toISOString().slice(0, 10).replace(/-/g, '');
             
             await client.searchJournalPapers(journals, lookbackDays);
@@ -183,6 +251,20 @@ describe('ElsevierClient', () => {
             expect(calledUrl).toContain(`ORIG-LOAD-DATE%20AFT%20${expectedDateStr}`);
         });
 
+        it('should calculate the date filter from the provided run time', async () => {
+            mockFetch.mockResolvedValueOnce({
+                ok: true,
+                json: () => Promise.resolve({
+                    'search-results': { entry: [] }
+                })
+            });
+
+            await client.searchJournalPapers(['NeuroImage'], 3, new Date('2024-03-15T12:00:00Z'));
+
+            const calledUrl = mockFetch.mock.calls[0][0];
+            expect(calledUrl).toContain('ORIG-LOAD-DATE%20AFT%2020240312');
+        });
+
         it('should default to 1 day lookback when lookbackDays is not provided', async () => {
             mockFetch.mockResolvedValueOnce({
                 ok: true,
@@ -195,7 +277,7 @@ describe('ElsevierClient', () => {
             
             // Calculate expected date (1 day ago - default)
             const expectedDate = new Date();
-            expectedDate.setDate(expectedDate.getDate() - 1);
+            expectedDate.setUTCDate(expectedDate.getUTCDate() - 1);
             const expectedDateStr = expectedDate.toISOString().slice(0, 10).replace(/-/g, '');
             
             await client.searchJournalPapers(journals);
@@ -0,0 +1,47 @@
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import { createLogger } from '../src/logger.js';
+
+describe('createLogger', () => {
+    afterEach(() => {
+        vi.restoreAllMocks();
+    });
+
+    it('should default to info level', () => {
+        const logger = createLogger();
+
+        expect(logger.isEnabled('debug')).toBe(false);
+        expect(logger.isEnabled('info')).toBe(true);
+        expect(logger.isEnabled('error')).toBe(true);
+    });
+
+    it('should drop messages below the configured level', () => {
+        const log = vi.spyOn(console, 'log').mockImplementation(() => {});
+        const warn = vi.spyOn(console, 'warn').mockImplementation(() => {});
+        const logger = createLogger('warn');
+
+        logger.info('hidden');
+        logger.warn('shown');
+
+        expect(log).not.toHaveBeenCalled();
+        expect(warn).toHaveBeenCalledWith('shown');
+    });
+
+    it('should warn and fall back to info for unknown levels', () => {
+        const warn = vi.spyOn(console, 'warn').mockImplementation(() => {});
+
+        const logger = createLogger('warning');
+
+        expect(warn).toHaveBeenCalledTimes(1);
+        expect(warn).toHaveBeenCalledWith(expect.stringContaining('Unknown log level "warning"'));
+        expect(logger.isEnabled('info')).toBe(true);
+        expect(logger.isEnabled('debug')).toBe(false);
+    });
+
+    it('should not warn for known levels', () => {
+        const warn = vi.spyOn(console, 'warn').mockImplementation(() => {});
+
+        createLogger('DEBUG');
+
+        expect(warn).not.toHaveBeenCalled();
+    });
+});
@@ -1,7 +1,11 @@
 import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { Agent } from 'https';
+import { Client } from '@notionhq/client';
 import { NotionClient, buildPaperPageContent, normalizeNotionPageId } from '../src/notion.js';
 import type { Paper, PaperSummary } from '../src/types.js';
 
+vi.mock('@notionhq/client', () => ({ Client: vi.fn() }));
+
 describe('normalizeNotionPageId', () => {
     const validUuid = '12345678-1234-1234-1234-123456789012';
     const compactUuid = '12345678123412341234123456789012';
@@ -125,6 +129,21 @@ describe('NotionClient', () => {
         });
     });
 
+    describe('NotionClient constructor', () => {
+        it('should pass a keep-alive agent to the Notion client', () => {
+            new NotionClient('test-token');
+
+            expect(vi.mocked(Client)).toHaveBeenCalledWith(
+                expect.objectContaining({
+                    auth: 'test-token',
+                    agent: expect.any(Agent),
+                })
+            );
+            const { agent } = vi.mocked(Client).mock.calls.at(-1)![0]!;
+            expect((agent as Agent & { keepAlive: boolean }).keepAlive).toBe(true);
+        });
+    });
+
     describe('NotionClient.createPaperPage', () => {
         let client: NotionClient;
         let mockCreate: ReturnType<typeof vi.fn>;
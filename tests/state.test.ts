@@ -0,0 +1,98 @@
+import { describe, it, expect } from 'vitest';
+import { mkdtemp, readdir, rm } from 'fs/promises';
+import { tmpdir } from 'os';
+import { join } from 'path';
+import {
+    MAX_IMPORTED_DOIS,
+    filterNewPapers,
+    isImported,
+    loadState,
+    markImported,
+    saveState,
+} from '../src/state.js';
+import type { ImportState } from '../src/types.js';
+
+describe('state', () => {
+    const state: ImportState = {
+        importedDois: ['10.1016/j.example.2024.001', '10.1016/j.example.2024.002'],
+        lastRun: '2024-03-15T00:00:00.000Z',
+    };
+
+    describe('isImported', () => {
+        it('should report imported DOIs', () => {
+            expect(isImported(state, '10.1016/j.example.2024.001')).toBe(true);
+            expect(isImported(state, '10.1016/j.example.2024.003')).toBe(false);
+            expect(isImported(state, '10.1016/J.EXAMPLE.2024.001')).toBe(true);
+        });
+    });
+
+    describe('filterNewPapers', () => {
+        it('should drop papers that were already imported', () => {
+            const papers = [
+                { doi: '10.1016/j.example.2024.001' },
+                { doi: '10.1016/j.example.2024.003' },
+                { doi: '10.1016/j.example.2024.002' },
+            ];
+
+            expect(filterNewPapers(papers, state)).toEqual([{ doi: '10.1016/j.example.2024.003' }]);
+        });
+
+        it('should compare DOIs case-insensitively', () => {
+            const papers = [{ doi: '10.1016/J.EXAMPLE.2024.001' }];
+            expect(filterNewPapers(papers, state)).toEqual([]);
+        });
+
+        it('should drop duplicate DOIs within the results', () => {
+            const papers = [
+                { doi: '10.1016/j.example.2024.003', title: 'First' },
+                { doi: '10.1016/J.Example.2024.003', title: 'Duplicate' },
+            ];
+
+            expect(filterNewPapers(papers, state)).toEqual([papers[0]]);
+        });
+
+        it('should keep all papers when nothing was imported', () => {
+            const papers = [{ doi: '10.1016/j.example.2024.001' }];
+            expect(filterNewPapers(papers, { importedDois: [], lastRun: '' })).toEqual(papers);
+        });
+    });
+
+    describe('markImported', () => {
+        it('should append the DOI without mutating the original state', () => {
+            const updated = markImported(state, '10.1016/j.example.2024.003', '2024-03-16T00:00:00.000Z');
+
+            expect(updated.importedDois).toEqual([...state.importedDois, '10.1016/j.example.2024.003']);
+            expect(updated.lastRun).toBe('2024-03-16T00:00:00.000Z');
+            expect(state.importedDois).toHaveLength(2);
+        });
+
+        it('should drop the oldest DOIs once the limit is reached', () => {
+            const full: ImportState = {
+                importedDois: Array.from({ length: MAX_IMPORTED_DOIS }, (_, i) => `10.1016/old.${i}`),
+                lastRun: '',
+            };
+
+            const updated = markImported(full, '10.1016/new', '2024-03-16T00:00:00.000Z');
+
+            expect(updated.importedDois).toHaveLength(MAX_IMPORTED_DOIS);
+            expect(updated.importedDois[0]).toBe('10.1016/old.1');
+            expect(updated.importedDois.at(-1)).toBe('10.1016/new');
+        });
+    });
+
+    describe('saveState', () => {
+        it('should round-trip state without leaving a temporary file', async () => {
+            const dir = await mkdtemp(join(tmpdir(), 'paperboy-'));
+            const path = join(dir, 'import-state.json');
+
+            try {
+                await saveState(path, state);
+
+                expect(await loadState(path)).toEqual(state);
+                expect(await readdir(dir)).toEqual(['import-state.json']);
+            } finally {
+                await rm(dir, { recursive: true, force: true });
+            }
+        });
+    });
+});
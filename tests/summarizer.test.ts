@@ -1,5 +1,13 @@
-import { describe, it, expect, vi, beforeEach } from 'vitest';
-import { Summarizer, buildSummaryPrompt, parseSummaryResponse } from '../src/summarizer.js';
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import {
+    MAX_CONTENT_CHARS,
+    Summarizer,
+    buildBatchSummaryPrompt,
+    buildSummaryPrompt,
+    parseBatchSummaryResponse,
+    parseSummaryResponse,
+    truncateContent,
+} from '../src/summarizer.js';
 import type { Paper, PaperSummary } from '../src/types.js';
 
 describe('Summarizer', () => {
@@ -83,6 +91,91 @@ describe('Summarizer', () => {
         });
     });
 
+    describe('truncateContent', () => {
+        it('should leave short content unchanged', () => {
+            const text = 'Effect was significant (T<Tc and T>0 K)';
+            expect(truncateContent(text)).toBe(text);
+        });
+
+        it('should truncate long content and be idempotent', () => {
+            const truncated = truncateContent('a'.repeat(MAX_CONTENT_CHARS * 2));
+
+            expect(truncated).toBe(`${'a'.repeat(MAX_CONTENT_CHARS)}...[truncated]`);
+            expect(truncateContent(truncated)).toBe(truncated);
+        });
+    });
+
+    describe('buildBatchSummaryPrompt', () => {
+        it('should number each paper in the prompt', () => {
+            const paper = (title: string): Paper => ({
+                doi: `10.1016/${title}`,
+                title,
+                authors: [],
+                abstract: '',
+                publicationDate: '',
+                journal: '',
+            });
+
+            const prompt = buildBatchSummaryPrompt([
+                { paper: paper('First Paper'), fullText: 'First content' },
+                { paper: paper('Second Paper'), fullText: 'Second content' },
+            ]);
+
+            expect(prompt).toContain('2 scientific papers');
+            expect(prompt).toContain('## Paper 1');
+            expect(prompt).toContain('**DOI:** 10.1016/First Paper');
+            expect(prompt).toContain('First Paper');
+            expect(prompt).toContain('## Paper 2');
+            expect(prompt).toContain('Second content');
+        });
+    });
+
+    describe('parseBatchSummaryResponse', () => {
+        const dois = ['10.1016/j.first', '10.1016/j.second'];
+
+        it('should match summaries to papers by DOI regardless of order', () => {
+            const llmResponse = JSON.stringify([
+                { doi: '10.1016/j.second', keyFindings: ['B'], methodology: '', implications: '', tldr: 'Second' },
+                { doi: '10.1016/J.FIRST', keyFindings: ['A'], methodology: '', implications: '', tldr: 'First' },
+            ]);
+
+            const summaries = parseBatchSummaryResponse(llmResponse, dois);
+
+            expect(summaries[0]?.tldr).toBe('First');
+            expect(summaries[1]?.tldr).toBe('Second');
+        });
+
+        it('should ignore 0-based indices and match on DOI', () => {
+            const llmResponse = JSON.stringify([
+                { index: 0, doi: '10.1016/j.first', tldr: 'First' },
+                { index: 1, doi: '10.1016/j.second', tldr: 'Second' },
+            ]);
+
+            const summaries = parseBatchSummaryResponse(llmResponse, dois);
+
+            expect(summaries[0]?.tldr).toBe('First');
+            expect(summaries[1]?.tldr).toBe('Second');
+        });
+
+        it('should leave papers missing from the response undefined', () => {
+            const llmResponse = JSON.stringify([
+                { doi: '10.1016/j.first', tldr: 'First' },
+                { doi: '10.1016/j.unknown', tldr: 'Bogus' },
+                { index: 2, tldr: 'No DOI' },
+            ]);
+
+            const summaries = parseBatchSummaryResponse(llmResponse, dois);
+
+            expect(summaries[0]?.tldr).toBe('First');
+            expect(summaries[1]).toBeUndefined();
+        });
+
+        it('should return all undefined on parse error', () => {
+            const summaries = parseBatchSummaryResponse('Invalid response', [...dois, '10.1016/j.third']);
+            expect(summaries).toEqual([undefined, undefined, undefined]);
+        });
+    });
+
     describe('Summarizer.summarize', () => {
         let summarizer: Summarizer;
         let mockGenerateContent: ReturnType<typeof vi.fn>;
@@ -130,5 +223,156 @@ describe('Summarizer', () => {
             );
             expect(summary.tldr).toBe('Summary');
         });
+
+        it('should reuse the generative model across calls', async () => {
+            const getGenerativeModel = vi.fn().mockReturnValue({
+                generateContent: mockGenerateContent,
+            });
+            // @ts-expect-error - mocking private genAI
+            summarizer.genAI = { getGenerativeModel };
+            mockGenerateContent.mockResolvedValue({
+                response: { text: () => '{"tldr": "Summary"}' },
+            });
+
+            const paper: Paper = {
+                doi: '10.1016/test',
+                title: 'Test Paper',
+                authors: [],
+                abstract: 'Abstract',
+                publicationDate: '',
+                journal: '',
+            };
+
+            await summarizer.summarize(paper);
+            await summarizer.summarize(paper);
+
+            expect(getGenerativeModel).toHaveBeenCalledTimes(1);
+            expect(mockGenerateContent).toHaveBeenCalledTimes(2);
+        });
+    });
+
+    describe('Summarizer.summarizeBatch', () => {
+        let summarizer: Summarizer;
+        let mockGenerateContent: ReturnType<typeof vi.fn>;
+
+        const items = ['First', 'Second', 'Third'].map((title) => ({
+            paper: {
+                doi: `10.1016/${title}`,
+                title,
+                authors: [],
+                abstract: 'Abstract',
+                publicationDate: '',
+                journal: '',
+            } as Paper,
+            fullText: '',
+        }));
+
+        beforeEach(() => {
+            mockGenerateContent = vi.fn();
+            summarizer = new Summarizer('test-key', 'gemini-2.5-flash-lite');
+            // @ts-expect-error - mocking private genAI
+            summarizer.genAI = {
+                getGenerativeModel: () => ({
+                    generateContent: mockGenerateContent,
+                }),
+            };
+        });
+
+        it('should summarize all papers with a single request', async () => {
+            mockGenerateContent.mockResolvedValueOnce({
+                response: {
+                    text: () => JSON.stringify(items.map(({ paper }, i) => ({ doi: paper.doi, tldr: `Summary ${i + 1}` }))),
+                },
+            });
+
+            const summaries = await summarizer.summarizeBatch(items);
+
+            expect(mockGenerateContent).toHaveBeenCalledTimes(1);
+            expect(mockGenerateContent).toHaveBeenCalledWith(
+                expect.objectContaining({
+                    generationConfig: expect.objectContaining({ responseMimeType: 'application/json' }),
+                })
+            );
+            expect(summaries.map((s) => s.tldr)).toEqual(['Summary 1', 'Summary 2', 'Summary 3']);
+        });
+
+        it('should fall back to single requests for papers missing from the batch', async () => {
+            mockGenerateContent
+                .mockResolvedValueOnce({
+                    response: { text: () => JSON.stringify([{ doi: items[0].paper.doi, tldr: 'Summary 1' }]) },
+                })
+                .mockResolvedValue({
+                    response: { text: () => JSON.stringify({ tldr: 'Single summary' }) },
+                });
+
+            const summaries = await summarizer.summarizeBatch(items);
+
+            expect(mockGenerateContent).toHaveBeenCalledTimes(3);
+            expect(summaries.map((s) => s.tldr)).toEqual(['Summary 1', 'Single summary', 'Single summary']);
+        });
+
+        it('should run fallback requests concurrently up to the limit', async () => {
+            let inFlight = 0;
+            let maxInFlight = 0;
+            summarizer = new Summarizer('test-key', 'gemini-2.5-flash-lite', 2);
+            // @ts-expect-error - mocking private genAI
+            summarizer.genAI = {
+                getGenerativeModel: () => ({
+                    generateContent: async () => {
+                        inFlight++;
+                        maxInFlight = Math.max(maxInFlight, inFlight);
+                        await new Promise((resolve) => setTimeout(resolve, 5));
+                        inFlight--;
+                        return { response: { text: () => 'Invalid response' } };
+                    },
+                }),
+            };
+
+            await summarizer.summarizeBatch(items);
+
+            expect(maxInFlight).toBe(2);
+        });
+
+        describe('rate limiting', () => {
+            beforeEach(() => {
+                vi.useFakeTimers();
+            });
+
+            afterEach(() => {
+                vi.useRealTimers();
+            });
+
+            it('should retry rate-limited requests', async () => {
+                mockGenerateContent
+                    .mockRejectedValueOnce(Object.assign(new Error('Resource exhausted'), { status: 429 }))
+                    .mockResolvedValueOnce({
+                        response: { text: () => JSON.stringify({ tldr: 'Summary' }) },
+                    });
+
+                const promise = summarizer.summarize(items[0].paper);
+                await vi.runAllTimersAsync();
+                const summary = await promise;
+
+                expect(mockGenerateContent).toHaveBeenCalledTimes(2);
+                expect(summary.tldr).toBe('Summary');
+            });
+
+            it('should not fall back to single requests when the batch stays rate limited', async () => {
+                mockGenerateContent.mockRejectedValue(
+                    Object.assign(new Error('Resource exhausted'), { status: 429 })
+                );
+
+                const promise = summarizer.summarizeBatch(items);
+                await vi.runAllTimersAsync();
+                const summaries = await promise;
+
+                // One initial attempt plus the retries, and no per-paper requests
+                expect(mockGenerateContent).toHaveBeenCalledTimes(4);
+                expect(summaries).toHaveLength(items.length);
+                for (const summary of summaries) {
+                    expect(summary.tldr).toContain('Error generating summary');
+                }
+            });
+        });
     });
 });